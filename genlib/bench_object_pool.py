@@ -0,0 +1,66 @@
+"""
+    Benchmark
+
+    Compares loading a value into a new StandardType each time against borrowing
+    one from an ObjectPool.
+
+        python bench_object_pool.py [loads]
+
+    Each case is run a few times and the fastest run is reported.
+"""
+
+import sys
+import time
+
+from object_pool import *
+from standard_type import *
+
+
+def make_schema():
+    schema = StandardType()
+    schema.type = [TypeConsts.String, TypeConsts.Number]
+    schema.minimum = 1
+    return schema
+
+
+def run_new(loads):
+    start = time.perf_counter()
+    for i in range(loads):
+        obj = make_schema()
+        obj.load_from_object(i + 1)
+    return time.perf_counter() - start
+
+
+def run_borrow(loads):
+    pool = ObjectPool(make_schema)
+    start = time.perf_counter()
+    for i in range(loads):
+        with pool.borrow() as obj:
+            obj.load_from_object(i + 1)
+    return time.perf_counter() - start
+
+
+def run_acquire(loads):
+    pool = ObjectPool(make_schema)
+    start = time.perf_counter()
+    for i in range(loads):
+        obj = pool.acquire()
+        obj.load_from_object(i + 1)
+        pool.release(obj)
+    return time.perf_counter() - start
+
+
+REPEATS = 5
+
+
+def main():
+    loads = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    for name, run in [("new object", run_new),
+                      ("pool.borrow()", run_borrow),
+                      ("pool.acquire()/release()", run_acquire)]:
+        seconds = min(run(loads) for _ in range(REPEATS))
+        print(f"{name}: {seconds:.3f}s for {loads} loads")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+    Benchmark
+
+    Measures StandardType.validate throughput as the number of threads sharing one
+    schema object grows. On a free-threaded CPython build the rate should scale
+    with the thread count, with the GIL enabled it stays roughly flat.
+
+        python bench_standard_type.py [loads per thread]
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from standard_type import *
+
+
+def make_schema():
+    schema = StandardType()
+    schema.type = [TypeConsts.String, TypeConsts.Number]
+    schema.pattern = "[0-9]+\\.[0-9][0-9]$"
+    schema.minimum = 0
+    schema.maximum = 10 ** 9
+    return schema
+
+
+def run(schema, threads, loads):
+    def work(_):
+        for i in range(loads):
+            schema.validate(i)
+            schema.validate("350.00")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(work, range(threads)))
+    return (threads * loads * 2) / (time.perf_counter() - start)
+
+
+def main():
+    loads = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL enabled: {gil_enabled}")
+
+    schema = make_schema()
+    base_rate = None
+    for threads in [1, 2, 4, 8]:
+        rate = run(schema, threads, loads)
+        if base_rate is None:
+            base_rate = rate
+        print(f"{threads} threads: {rate:.0f} loads/s ({rate / base_rate:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,8 +12,14 @@ class ContainerType(object):
     def load_from_object(self, input_object):
         pass
 
+    def load_from_json(self, raw_input):
+        pass
+
     def dump_to_object(self):
         pass
 
     def checksum(self):
         pass
+
+    def reset(self):
+        pass
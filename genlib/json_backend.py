@@ -0,0 +1,73 @@
+"""
+    JSON Backend
+
+    Decodes raw JSON with orjson when it is installed, and falls back to the
+    standard library json module when it is not. Both backends return the same
+    result for the same input.
+"""
+
+import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson releases before this crash the interpreter on deeply nested input, so
+# they are treated as not installed.
+ORJSON_MIN_VERSION = (3, 9, 15)
+
+
+def _version_tuple(version):
+    return tuple(int(part) for part in re.findall(r"[0-9]+", version)[:3])
+
+
+if orjson is not None and _version_tuple(orjson.__version__) < ORJSON_MIN_VERSION:
+    orjson = None
+
+# orjson decodes integers above the unsigned 64 bit maximum, or below the signed
+# 64 bit minimum, as floats. Integral floats at or past these bounds may be one.
+_UINT64_LIMIT = 18446744073709551616.0
+_INT64_MIN = -9223372036854775808.0
+
+
+def _is_rounded_integer(value):
+    return value.is_integer() and (value >= _UINT64_LIMIT or value <= _INT64_MIN)
+
+
+def _has_rounded_integer(document):
+    if type(document) is float:
+        return _is_rounded_integer(document)
+    if type(document) is not dict and type(document) is not list:
+        return False
+
+    pending = [document]
+    while pending:
+        container = pending.pop()
+        if type(container) is dict:
+            container = container.values()
+        for value in container:
+            if type(value) is float:
+                if _is_rounded_integer(value):
+                    return True
+            elif type(value) is dict or type(value) is list:
+                pending.append(value)
+    return False
+
+
+def loads(raw_input):
+    if orjson is not None:
+        try:
+            document = orjson.loads(raw_input)
+        except orjson.JSONDecodeError:
+            # Input orjson rejects but json accepts, like NaN or a UTF-8 BOM, is
+            # decoded by json below, which also reports real errors.
+            pass
+        else:
+            if not _has_rounded_integer(document):
+                return document
+
+    if type(raw_input) is not str and type(raw_input) is not bytes and type(raw_input) is not bytearray:
+        raw_input = bytes(raw_input)
+    return json.loads(raw_input)
@@ -0,0 +1,74 @@
+"""
+    Load Cache
+
+    A load cache remembers the objects loaded from raw JSON input, so that a
+    duplicate payload for the same schema skips decoding and validation and gets a
+    copy of the object loaded the first time.
+
+    Copies are made with copy.copy, so a type which holds child objects must define
+    __copy__ to copy them, otherwise the copy shares its children with the cache.
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class LoadCache(object):
+    def __init__(self, max_size=1024):
+        super().__init__()
+        if type(max_size) is not int or max_size < 1:
+            raise ValueError("max_size must be a positive int.")
+        # Largest number of loaded objects to hold on to.
+        self._max_size = max_size
+        # Maps (schema, input digest) to the loaded object, oldest first.
+        self._entries = OrderedDict()
+        # Guards the entries and counters, the cache is shared between threads.
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, factory, raw_input):
+        """
+            Loads raw_input with a new object from factory, unless the same input
+            was already loaded for that factory, in which case a copy of the cached
+            object is returned. Input which fails to load is not cached.
+        """
+        if type(raw_input) is str:
+            raw_bytes = raw_input.encode("utf-8")
+        else:
+            raw_bytes = raw_input
+        try:
+            digest = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+        except TypeError:
+            raise ValueError(f"raw input must be str or a bytes like object, not {str(type(raw_input))}")
+
+        key = (factory, digest)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if cached is not None:
+            return copy.copy(cached)
+
+        obj = factory()
+        obj.load_from_json(raw_input)
+
+        with self._lock:
+            self._entries[key] = obj
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return copy.copy(obj)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
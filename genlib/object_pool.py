@@ -0,0 +1,67 @@
+"""
+    Object Pool
+
+    An object pool holds previously loaded objects for a schema, so that repeated
+    loads of the same schema can reuse them instead of building a new object each
+    time.
+"""
+
+
+class _Borrow(object):
+    # Pairs one pooled object with the context manager that hands it out, so the
+    # same wrapper is reused on every borrow of that object.
+    __slots__ = ("_pool", "obj")
+
+    def __init__(self, pool, obj):
+        self._pool = pool
+        self.obj = obj
+
+    def __enter__(self):
+        return self.obj
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._pool._put(self)
+        return False
+
+
+class ObjectPool(object):
+    def __init__(self, factory, max_size=64):
+        super().__init__()
+        if not callable(factory):
+            raise ValueError("factory must be callable and return a new schema object.")
+        if type(max_size) is not int or max_size < 0:
+            raise ValueError("max_size must be a non negative int.")
+        # Builds a new schema object when the pool is empty.
+        self._factory = factory
+        # Largest number of idle objects to hold on to.
+        self._max_size = max_size
+        # Idle objects in their borrow wrappers, ready to be borrowed.
+        self._free = []
+        # ids of the idle objects, so a second release of one is caught.
+        self._idle_ids = set()
+
+    def borrow(self):
+        try:
+            borrowed = self._free.pop()
+        except IndexError:
+            return _Borrow(self, self._factory())
+        self._idle_ids.discard(id(borrowed.obj))
+        return borrowed
+
+    def acquire(self):
+        return self.borrow().obj
+
+    def release(self, obj):
+        self._put(_Borrow(self, obj))
+
+    def _put(self, borrowed):
+        obj_id = id(borrowed.obj)
+        if obj_id in self._idle_ids:
+            raise ValueError("object was already released to the pool.")
+        borrowed.obj.reset()
+        if len(self._free) < self._max_size:
+            self._idle_ids.add(obj_id)
+            self._free.append(borrowed)
+
+    def __len__(self):
+        return len(self._free)
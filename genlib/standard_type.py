@@ -6,12 +6,22 @@
 """
 
 import ipaddress
+import re
 
 import aniso8601
 import rfc3987
 from fqdn import *
 
 from consts import *
+from json_backend import loads
+
+# Matches the first token of a JSON document, with one group for each type in
+# _FIRST_TOKEN_TYPES. Anything else is left for the decoder to report.
+_FIRST_TOKEN_PATTERN = r'[ \t\r\n]*(?:(")|(\{)|(\[)|(true|false)|(null)|(-?[0-9]))'
+_FIRST_TOKEN = re.compile(_FIRST_TOKEN_PATTERN)
+_FIRST_TOKEN_BYTES = re.compile(_FIRST_TOKEN_PATTERN.encode("ascii"))
+_FIRST_TOKEN_TYPES = [None, TypeConsts.String, TypeConsts.Object, TypeConsts.Array,
+                      TypeConsts.Boolean, TypeConsts.Null, TypeConsts.Number]
 
 
 class StandardType(object):
@@ -25,6 +35,7 @@ class StandardType(object):
         self._value = None
         # Pattern
         self._pattern = None
+        self._compiled_pattern = None
 
         # Minimum
         self._minimum = None
@@ -39,60 +50,97 @@ class StandardType(object):
         # Format
         self._format = None
 
-    def load_from_object(self, input_data):
-        load_worked = False
+    def reset(self):
+        # Clears the loaded value so the object can be reused for another load,
+        # the schema properties are left in place.
+        self._value = None
+
+    def __copy__(self):
+        # The value is immutable, but the schema properties held in lists and dicts
+        # are copied so that changing the copy does not change the original.
+        new_obj = type(self).__new__(type(self))
+        new_obj.__dict__.update(self.__dict__)
+        new_obj._property_names = dict(self._property_names)
         if type(self.type) is list:
-            types = self.type
+            new_obj.type = list(self.type)
+        if type(self._enumerations) is list:
+            new_obj._enumerations = list(self._enumerations)
+        return new_obj
+
+    def load_from_object(self, input_data):
+        self._value = self.validate(input_data)
+
+    def load_from_json(self, raw_input):
+        self._value = self.validate_json(raw_input)
+
+    def validate_json(self, raw_input):
+        # Checks the type of the document from its first character, so input of
+        # the wrong type is rejected before any of it is decoded.
+        if type(raw_input) is str:
+            match = _FIRST_TOKEN.match(raw_input)
         else:
-            types = [self.type]
+            match = _FIRST_TOKEN_BYTES.match(raw_input)
+
+        if match is not None:
+            vtype = _FIRST_TOKEN_TYPES[match.lastindex]
+            types = self._types()
+            if vtype not in types:
+                error_msg = f"JSON {vtype} did not match any of the types {types}"
+                raise (ValueError(error_msg))
 
+        return self.validate(loads(raw_input))
+
+    def validate(self, input_data):
+        # Returns the loaded value without storing it, only the schema properties
+        # are read, so one object can validate from many threads at once.
+        types = self._types()
         for vtype in types:
-            load_worked = self.load_value_type(vtype, input_data)
+            load_worked, value = self._convert_value_type(vtype, input_data)
             if load_worked:
-                break
+                return value
+
+        error_msg = f"'{input_data}' did not match any of the types {types}"
+        raise (ValueError(error_msg))
 
-        if not load_worked:
-            error_msg = f"'{input_data}' did not match any of the types {types}"
-            raise (ValueError(error_msg))
+    def _types(self):
+        if type(self.type) is list:
+            return self.type
+        return [self.type]
 
     def load_value_type(self, vtype, input_data) -> bool:
+        load_worked, value = self._convert_value_type(vtype, input_data)
+        if load_worked:
+            self._value = value
+        return load_worked
+
+    def _convert_value_type(self, vtype, input_data):
         if vtype == TypeConsts.String and type(input_data) is str:
-            self._value = input_data
-            if self._pattern:
-                p = re.compile(self._pattern)
-                if not p.match(self._value):
+            if self._compiled_pattern:
+                if not self._compiled_pattern.match(input_data):
                     raise ValueError("did not match pattern.")
             if self._format:
-                self._parse_string_format(input_data)
-            return True
+                return True, self._parse_string_format(input_data)
+            return True, input_data
 
         if vtype == TypeConsts.Number and (type(input_data) is float or
                                            type(input_data) is int):
-            self._value = input_data
-            if self._minimum:
-                if self._value >= self._minimum:
-                    return True
-                else:
-                    error_string = f"{self._value} is less then the Minimum of {self._minimum}"
-                    raise ValueError(error_string)
+            if self._minimum is not None and input_data < self._minimum:
+                error_string = f"{input_data} is less then the Minimum of {self._minimum}"
+                raise ValueError(error_string)
 
-            if self._maximum:
-                if self._value <= self._maximum:
-                    return True
-                else:
-                    error_string = f"{self._value} is greater then the Maximum of {self._maximum}"
-                    raise ValueError(error_string)
+            if self._maximum is not None and input_data > self._maximum:
+                error_string = f"{input_data} is greater then the Maximum of {self._maximum}"
+                raise ValueError(error_string)
 
-            return True
+            return True, input_data
 
         if vtype == TypeConsts.Boolean:
             if type(input_data) is not bool:
                 error_string = f"{input_data} is not a boolean type"
                 raise ValueError(error_string)
-            self._value = input_data
-            return True
+            return True, input_data
 
-        return False
+        return False, None
 
     def dump_to_object(self, hide_empty=True):
         pass
@@ -100,20 +148,17 @@ class StandardType(object):
     def _parse_string_format(self, input_data):
         if self._format in ["date-time", "time", "date"]:
             if self._format == "date-time":
-                self._value = aniso8601.parse_datetime(input_data)
-                return True
+                return aniso8601.parse_datetime(input_data)
             if self._format == "date":
-                self._value = aniso8601.parse_date(input_data)
-                return True
+                return aniso8601.parse_date(input_data)
             if self._format == "time":
-                self._value = aniso8601.parse_time(input_data)
-                return True
+                return aniso8601.parse_time(input_data)
 
         if self._format in ["email", "idn-email"]:
             if self._format == "email":
                 email_5621_pattern = r"""(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*")@(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?|\[(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?|[a-z0-9-]*[a-z0-9]:(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])"""
                 if re.match(email_5621_pattern, input_data):
-                    return True
+                    return input_data
                 errortext = f"""the supplied email '{input_data}' was not valid."""
                 raise ValueError(errortext)
 
@@ -124,26 +169,26 @@ class StandardType(object):
         if self._format in ["hostname", "idn-hostname"]:
             if self._format == "hostname":
                 if FQDN(input_data).is_valid:
-                    return True
+                    return input_data
             if self._format == "idn-hostname":
                 errortext = f"""the supplied idn-hostname format is not supported"""
                 raise ValueError(errortext)
 
         if self._format in ["ipv4", "ipv6"]:
             ipaddress.ip_address(input_data)
-            return True
+            return input_data
 
         if self._format in ["uri", "iri"]:
             if self._format == "uri":
                 if rfc3987.match(input_data, rule='URI'):
-                    return True
+                    return input_data
                 else:
                     errortext = f"url:'{input_data}' not a valid url."
                     raise ValueError(errortext)
 
             if self._format == "iri":
                 if rfc3987.match(input_data, rule='IRI'):
-                    return True
+                    return input_data
                 else:
                     errortext = f"iri:'{input_data}' not a valid iri."
                     raise ValueError(errortext)
@@ -188,6 +233,7 @@ class StandardType(object):
     @pattern.setter
     def pattern(self, newvalue):
         self._pattern = newvalue
+        self._compiled_pattern = re.compile(newvalue) if newvalue else None
 
     @property
     def minimum(self):
@@ -0,0 +1,55 @@
+import json
+import unittest
+from unittest import mock
+
+import json_backend
+from json_backend import loads
+
+
+class TestJsonBackend(unittest.TestCase):
+    def test_loads(self):
+        self.assertEqual({"a": [1, 2.5, "x", None, True]},
+                         loads(b'{"a": [1, 2.5, "x", null, true]}'))
+        self.assertEqual([1], loads("[1]"))
+        self.assertEqual([1], loads(memoryview(b"[1]")))
+        self.assertEqual([1], loads(bytearray(b"[1]")))
+
+    def test_keeps_large_integers(self):
+        document = loads(b'[1, {"a": [123456789012345678901234567890]}, -9223372036854775809]')
+
+        self.assertEqual([1, {"a": [123456789012345678901234567890]}, -9223372036854775809], document)
+        self.assertIs(int, type(document[2]))
+
+    def test_keeps_64_bit_integers(self):
+        document = loads(b"[18446744073709551615, -9223372036854775808, 1e20]")
+
+        self.assertEqual([18446744073709551615, -9223372036854775808, 1e20], document)
+
+    def test_reports_invalid_json(self):
+        for test_data in [b"hello", b"[1,", b""]:
+            with self.assertRaises(json.JSONDecodeError):
+                loads(test_data)
+
+    def test_long_digits_use_orjson(self):
+        if json_backend.orjson is None:
+            self.skipTest("orjson is not installed")
+
+        test_data = memoryview(b'{"ts": "1700000000000000000", "id": 18446744073709551615, '
+                               b'"s": "123456789012345678901234567890"}')
+        with mock.patch.object(json_backend.json, "loads", side_effect=AssertionError("fell back to json")):
+            document = loads(test_data)
+
+        self.assertEqual("1700000000000000000", document["ts"])
+        self.assertEqual(18446744073709551615, document["id"])
+
+
+class TestJsonBackendStdlib(TestJsonBackend):
+    # Runs the same tests with orjson disabled, so json does the decoding.
+    def setUp(self):
+        patcher = mock.patch.object(json_backend, "orjson", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import threading
+import unittest
+from unittest import mock
+
+import json_backend
+from load_cache import *
+from standard_type import *
+
+
+class TestLoadCache(unittest.TestCase):
+    def test_duplicate_input_is_a_hit(self):
+        def make_number_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.Number
+            return testobj
+
+        cache = LoadCache()
+
+        first = cache.load(make_number_type, b"350")
+        second = cache.load(make_number_type, "350")
+
+        self.assertEqual(350, first.value)
+        self.assertEqual(350, second.value)
+        self.assertIsNot(first, second)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_copies_are_independent(self):
+        def make_enumeration_type():
+            testobj = StandardType()
+            testobj.type = [TypeConsts.Number]
+            testobj.enumerations = [350, 1]
+            return testobj
+
+        cache = LoadCache()
+
+        first = cache.load(make_enumeration_type, b"350")
+        first.value = 1
+        first.enumerations.append(2)
+        first.type.append(TypeConsts.String)
+
+        second = cache.load(make_enumeration_type, b"350")
+        self.assertEqual(350, second.value)
+        self.assertEqual([350, 1], second.enumerations)
+        self.assertEqual([TypeConsts.Number], second.type)
+
+    def test_schema_is_part_of_the_key(self):
+        def make_number_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.Number
+            return testobj
+
+        def make_string_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.String
+            return testobj
+
+        cache = LoadCache()
+
+        cache.load(make_string_type, b""" "350" """)
+        with self.assertRaises(ValueError):
+            cache.load(make_number_type, b""" "350" """)
+
+        self.assertEqual(1, len(cache))
+
+    def test_evicts_least_recently_used(self):
+        def make_number_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.Number
+            return testobj
+
+        cache = LoadCache(max_size=2)
+
+        cache.load(make_number_type, b"1")
+        cache.load(make_number_type, b"2")
+        cache.load(make_number_type, b"1")
+        cache.load(make_number_type, b"3")
+        self.assertEqual(2, len(cache))
+
+        cache.load(make_number_type, b"1")
+        self.assertEqual(2, cache.hits)
+
+        cache.load(make_number_type, b"2")
+        self.assertEqual(4, cache.misses)
+
+    def test_invalid_input_type(self):
+        def make_number_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.Number
+            return testobj
+
+        cache = LoadCache()
+
+        with self.assertRaises(ValueError):
+            cache.load(make_number_type, 350)
+
+    def test_accepts_buffers(self):
+        def make_number_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.Number
+            return testobj
+
+        cache = LoadCache()
+
+        data = b'{"a": 1}\n350\n'
+        with memoryview(data)[9:12] as record:
+            self.assertEqual(350, cache.load(make_number_type, record).value)
+        self.assertEqual(350, cache.load(make_number_type, bytearray(b"350")).value)
+
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, len(cache))
+
+    def test_rejects_wrong_type_before_decoding(self):
+        def make_number_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.Number
+            return testobj
+
+        cache = LoadCache()
+
+        # Not valid JSON, but the leading '[' is enough to reject it.
+        with self.assertRaises(ValueError) as context:
+            cache.load(make_number_type, b"[1, 2, not json")
+        self.assertIn(TypeConsts.Array, str(context.exception))
+        self.assertEqual(0, len(cache))
+
+    def test_load_from_many_threads(self):
+        def make_number_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.Number
+            return testobj
+
+        cache = LoadCache(max_size=4)
+        failures = []
+
+        def work():
+            try:
+                for i in range(500):
+                    number = i % 8
+                    self.assertEqual(number, cache.load(make_number_type, str(number)).value)
+            except Exception as e:
+                failures.append(e)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], failures)
+        self.assertEqual(4, len(cache))
+
+    def test_keeps_large_integers(self):
+        def make_number_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.Number
+            return testobj
+
+        cache = LoadCache()
+
+        testobj = cache.load(make_number_type, b"123456789012345678901234567890")
+        self.assertEqual(123456789012345678901234567890, testobj.value)
+
+
+class TestLoadCacheStdlib(TestLoadCache):
+    # Runs the same tests with orjson disabled, so json does the decoding.
+    def setUp(self):
+        patcher = mock.patch.object(json_backend, "orjson", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+if __name__ == '__main__':
+    unittest.main()
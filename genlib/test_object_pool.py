@@ -0,0 +1,146 @@
+import json
+import unittest
+
+from object_pool import *
+from standard_type import *
+
+
+class TestObjectPool(unittest.TestCase):
+    def test_borrow_loads_value(self):
+        def make_string_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.String
+            return testobj
+
+        pool = ObjectPool(make_string_type)
+
+        test_data = """ "test string" """
+        obj = json.loads(test_data)
+        with pool.borrow() as testobj:
+            testobj.load_from_object(obj)
+            self.assertEqual("test string", testobj.value)
+
+    def test_borrow_reuses_and_resets_only_the_value(self):
+        def make_pattern_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.String
+            testobj.pattern = "[a-z]+$"
+            return testobj
+
+        pool = ObjectPool(make_pattern_type)
+
+        with pool.borrow() as testobj:
+            testobj.load_from_object("first")
+            first = testobj
+
+        self.assertEqual(1, len(pool))
+
+        with pool.borrow() as testobj:
+            self.assertIs(first, testobj)
+            self.assertIsNone(testobj.value)
+            self.assertEqual(TypeConsts.String, testobj.type)
+            self.assertEqual("[a-z]+$", testobj.pattern)
+            with self.assertRaises(ValueError):
+                testobj.load_from_object("350")
+
+    def test_borrow_returns_object_on_error(self):
+        def make_string_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.String
+            return testobj
+
+        pool = ObjectPool(make_string_type)
+
+        with self.assertRaises(ValueError):
+            with pool.borrow() as testobj:
+                testobj.load_from_object(350)
+
+        self.assertEqual(1, len(pool))
+
+    def test_nested_borrows_get_different_objects(self):
+        def make_string_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.String
+            return testobj
+
+        pool = ObjectPool(make_string_type)
+
+        with pool.borrow() as first:
+            with pool.borrow() as second:
+                self.assertIsNot(first, second)
+
+        self.assertEqual(2, len(pool))
+
+    def test_release_twice_fails(self):
+        def make_string_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.String
+            return testobj
+
+        pool = ObjectPool(make_string_type)
+
+        testobj = pool.acquire()
+        pool.release(testobj)
+        with self.assertRaises(ValueError):
+            pool.release(testobj)
+
+        self.assertEqual(1, len(pool))
+
+    def test_exit_twice_fails(self):
+        def make_string_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.String
+            return testobj
+
+        pool = ObjectPool(make_string_type)
+
+        borrowed = pool.borrow()
+        with borrowed:
+            pass
+        with self.assertRaises(ValueError):
+            borrowed.__exit__(None, None, None)
+
+        self.assertEqual(1, len(pool))
+
+    def test_release_of_borrowed_object_fails_on_exit(self):
+        def make_string_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.String
+            return testobj
+
+        pool = ObjectPool(make_string_type)
+
+        with self.assertRaises(ValueError):
+            with pool.borrow() as testobj:
+                pool.release(testobj)
+
+        self.assertEqual(1, len(pool))
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertIsNot(first, second)
+
+    def test_max_size_limits_idle_objects(self):
+        def make_string_type():
+            testobj = StandardType()
+            testobj.type = TypeConsts.String
+            return testobj
+
+        pool = ObjectPool(make_string_type, max_size=1)
+
+        first = pool.acquire()
+        second = pool.acquire()
+        pool.release(first)
+        pool.release(second)
+
+        self.assertEqual(1, len(pool))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ObjectPool(None)
+
+        with self.assertRaises(ValueError):
+            ObjectPool(StandardType, max_size=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,10 @@
 import json
+import math
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
+import json_backend
 from standard_type import *
 
 
@@ -133,6 +137,32 @@ class TestStandardType(unittest.TestCase):
         with self.assertRaises(ValueError):
             testobj.load_from_object(obj)
 
+    def test_supports_zero_minimum_and_maximum(self):
+        testobj = StandardType()
+        testobj.type = [TypeConsts.Number]
+        testobj.minimum = 0
+
+        with self.assertRaises(ValueError):
+            testobj.load_from_object(-1)
+
+        testobj.minimum = None
+        testobj.maximum = 0
+
+        with self.assertRaises(ValueError):
+            testobj.load_from_object(1)
+
+    def test_supports_minimum_and_maximum_together(self):
+        testobj = StandardType()
+        testobj.type = [TypeConsts.Number]
+        testobj.minimum = 1
+        testobj.maximum = 10
+
+        testobj.load_from_object(5)
+        self.assertEqual(5, testobj.value)
+
+        with self.assertRaises(ValueError):
+            testobj.load_from_object(11)
+
     def test_maximum_and_minimum_values_are_not_invalid(self):
         testobj = StandardType()
         testobj.type = [TypeConsts.Number]
@@ -454,6 +484,111 @@ class TestStandardType(unittest.TestCase):
             with self.assertRaises(ValueError):
                 testobj.load_from_object(obj)
 
+    def test_validate_does_not_store_value(self):
+        testobj = StandardType()
+        testobj.type = TypeConsts.String
+
+        self.assertEqual("test string", testobj.validate("test string"))
+        self.assertIsNone(testobj.value)
+
+    def test_validate_from_many_threads(self):
+        testobj = StandardType()
+        testobj.type = [TypeConsts.String, TypeConsts.Number]
+        testobj.pattern = "[0-9]+$"
+        testobj.minimum = 0
+        testobj.maximum = 64
+
+        def check(number):
+            for _ in range(200):
+                self.assertEqual(number, testobj.validate(number))
+                self.assertEqual(str(number), testobj.validate(str(number)))
+                with self.assertRaises(ValueError):
+                    testobj.validate(f"x{number}")
+                with self.assertRaises(ValueError):
+                    testobj.validate(-number)
+                with self.assertRaises(ValueError):
+                    testobj.validate(number + 64)
+            return number
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(check, range(1, 65)))
+
+        self.assertEqual(list(range(1, 65)), results)
+
+
+class TestStandardTypeLoadFromJson(unittest.TestCase):
+    def test_load_from_json(self):
+        testobj = StandardType()
+        testobj.type = [TypeConsts.String, TypeConsts.Number]
+
+        testobj.load_from_json(b""" "350.00" """)
+        self.assertEqual("350.00", testobj.value)
+
+        testobj.load_from_json("350")
+        self.assertEqual(350, testobj.value)
+
+        testobj.load_from_json(memoryview(b"-350"))
+        self.assertEqual(-350, testobj.value)
+
+    def test_load_from_json_rejects_wrong_type_before_decoding(self):
+        testobj = StandardType()
+        testobj.type = TypeConsts.Number
+
+        # Not valid JSON, but the leading '[' is enough to reject it.
+        with self.assertRaises(ValueError) as context:
+            testobj.load_from_json(b"  [1, 2, not json")
+        self.assertIn(TypeConsts.Array, str(context.exception))
+
+        with self.assertRaises(ValueError):
+            testobj.load_from_json(b"true")
+
+    def test_load_from_json_reports_invalid_json(self):
+        testobj = StandardType()
+        testobj.type = TypeConsts.String
+
+        for test_data in [b"hello", "hello", b"nope", b"-x", b""]:
+            with self.assertRaises(json.JSONDecodeError):
+                testobj.load_from_json(test_data)
+
+    def test_load_from_json_still_checks_constraints(self):
+        testobj = StandardType()
+        testobj.type = TypeConsts.Number
+        testobj.minimum = 351
+
+        with self.assertRaises(ValueError):
+            testobj.load_from_json(b"350")
+
+    def test_load_from_json_keeps_large_integers(self):
+        testobj = StandardType()
+        testobj.type = TypeConsts.Number
+
+        testobj.load_from_json(b"123456789012345678901234567890")
+        self.assertEqual(123456789012345678901234567890, testobj.value)
+
+        testobj.load_from_json("-9223372036854775809")
+        self.assertEqual(-9223372036854775809, testobj.value)
+
+    def test_load_from_json_matches_json_module(self):
+        testobj = StandardType()
+        testobj.type = TypeConsts.Number
+
+        testobj.load_from_json(b"NaN")
+        self.assertTrue(math.isnan(testobj.value))
+
+        testobj.load_from_json(b"Infinity")
+        self.assertEqual(math.inf, testobj.value)
+
+        testobj.load_from_json(b"\xef\xbb\xbf350")
+        self.assertEqual(350, testobj.value)
+
+
+class TestStandardTypeLoadFromJsonStdlib(TestStandardTypeLoadFromJson):
+    # Runs the same tests with orjson disabled, so json does the decoding.
+    def setUp(self):
+        patcher = mock.patch.object(json_backend, "orjson", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
 
 if __name__ == '__main__':
     unittest.main()
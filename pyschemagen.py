@@ -3,13 +3,37 @@
 
     This is an object generator which uses JSON Schema as the input, and generates
     python code.
+
+    It can also be run from the command line to validate JSON and NDJSON files
+    against a schema:
+
+        python pyschemagen.py validate --schema schema.json data/*.ndjson --jobs 4
 """
 
 
+import argparse
 import json
+import mmap
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
 import jsonschema
 import requests
 
+from genlib.json_backend import loads
+
+# Number of error messages printed for each file.
+MAX_REPORTED_ERRORS = 5
+
+# Matches any non whitespace byte, used to skip blank NDJSON lines.
+_NON_BLANK = re.compile(rb"\S")
+
+# Validator for the schema, compiled once in each worker process.
+_validator = None
+
 
 def generate_from_schema(path=None, text=None, url=None, validate = False):
     if path is None and text is None and url is None:
@@ -17,10 +41,7 @@ def generate_from_schema(path=None, text=None, url=None, validate = False):
 
     jsonobj = None
     if path:
-        f = open(path,"r")
-        jsondata = f.read()
-        f.close()
-        jsonobj = json.loads(jsondata)
+        jsonobj = load_json_file(path)
 
     if text:
         jsonobj = json.loads(text)
@@ -39,3 +60,174 @@ def generate_from_schema(path=None, text=None, url=None, validate = False):
     check = jsonschema.Draft7Validator()
     if not check:
         raise ValueError("Error validating the schema")
+
+
+@contextmanager
+def map_file(path):
+    """
+        Memory maps the file at path read only, and yields a memoryview of the map.
+        Any slices taken from the view must be released before the block exits.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        if f.tell() == 0:
+            # Empty files can't be mapped.
+            yield memoryview(b"")
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                yield view
+
+
+def load_json_file(path):
+    """
+        Decodes the JSON file at path straight from its memory map when orjson is
+        installed, json needs the mapped bytes copied first.
+    """
+    with map_file(path) as view:
+        return loads(view)
+
+
+def iter_ndjson_records(path):
+    """
+        Yields (line number, record) for each non blank line of an NDJSON file,
+        where record is a memoryview slice of the memory mapped file. A record is
+        only valid until the next one is requested.
+    """
+    with map_file(path) as view:
+        mapped = view.obj
+        size = len(view)
+        start = 0
+        line_number = 0
+        while start < size:
+            line_number += 1
+            end = mapped.find(b"\n", start)
+            if end == -1:
+                end = size
+            if _NON_BLANK.search(mapped, start, end):
+                with view[start:end] as record:
+                    yield line_number, record
+            start = end + 1
+
+
+def _init_validator(schema):
+    global _validator
+    _validator = jsonschema.Draft7Validator(schema)
+
+
+def _iter_records(path):
+    if path.endswith(".ndjson") or path.endswith(".jsonl"):
+        yield from iter_ndjson_records(path)
+    else:
+        with map_file(path) as view:
+            yield 1, view
+
+
+def validate_file(path):
+    records = 0
+    error_count = 0
+    errors = []
+    start = time.perf_counter()
+
+    try:
+        for line_number, raw in _iter_records(path):
+            records += 1
+            try:
+                document = loads(raw)
+                for error in _validator.iter_errors(document):
+                    error_count += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(f"line {line_number}: {error.message}")
+            except (ValueError, RecursionError) as e:
+                # RecursionError comes from documents nested too deeply to decode
+                # or validate, it fails the record rather than the whole run.
+                error_count += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append(f"line {line_number}: {e}")
+    except OSError as e:
+        error_count += 1
+        errors.append(str(e))
+
+    return {
+        "path": path,
+        "records": records,
+        "error_count": error_count,
+        "errors": errors,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _print_summary(result):
+    seconds = result["seconds"]
+    rate = result["records"] / seconds if seconds > 0 else 0.0
+    status = "FAIL" if result["error_count"] else "OK"
+    print(f"{status} {result['path']}: {result['records']} records, "
+          f"{result['error_count']} errors, {rate:.0f} records/s")
+    for error in result["errors"]:
+        print(f"    {error}")
+
+
+def _report(results):
+    passed = True
+    for result in results:
+        _print_summary(result)
+        if result["error_count"]:
+            passed = False
+    return passed
+
+
+def validate_files(schema, paths, jobs=1):
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1.")
+    jsonschema.Draft7Validator.check_schema(schema)
+
+    if jobs == 1 or len(paths) == 1:
+        _init_validator(schema)
+        return _report(map(validate_file, paths))
+
+    with ProcessPoolExecutor(max_workers=jobs,
+                             initializer=_init_validator,
+                             initargs=(schema,)) as executor:
+        return _report(executor.map(validate_file, paths))
+
+
+def _positive_int(text):
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"'{text}' is not a positive int")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="pyschemagen")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate_parser = commands.add_parser(
+        "validate", help="validate JSON and NDJSON files against a schema")
+    validate_parser.add_argument("--schema", required=True, help="path to the JSON schema")
+    validate_parser.add_argument("--jobs", type=_positive_int, default=1,
+                                 help="number of worker processes")
+    validate_parser.add_argument("files", nargs="+", help="JSON or NDJSON (.ndjson, .jsonl) files")
+
+    args = parser.parse_args(argv)
+
+    try:
+        schema = load_json_file(args.schema)
+        jsonschema.Draft7Validator.check_schema(schema)
+    except (OSError, ValueError) as e:
+        print(f"pyschemagen: could not load schema '{args.schema}': {e}", file=sys.stderr)
+        return 2
+    except jsonschema.SchemaError as e:
+        print(f"pyschemagen: invalid schema '{args.schema}': {e.message}", file=sys.stderr)
+        return 2
+
+    if validate_files(schema, args.files, args.jobs):
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import pyschemagen
+from genlib import json_backend
+from pyschemagen import *
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"a": {"type": "number"}},
+}
+
+
+class TestMapFile(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name, data):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def records(self, path):
+        return [(line_number, record.tobytes())
+                for line_number, record in iter_ndjson_records(path)]
+
+    def test_map_file(self):
+        path = self.write("data.json", b'{"a": 1}')
+
+        with map_file(path) as view:
+            self.assertEqual(b'{"a": 1}', view.tobytes())
+
+    def test_map_empty_file(self):
+        path = self.write("empty.json", b"")
+
+        with map_file(path) as view:
+            self.assertEqual(0, len(view))
+        self.assertEqual([], self.records(path))
+
+    def test_load_json_file(self):
+        path = self.write("data.json", b'{"a": [1, 2]}')
+
+        self.assertEqual({"a": [1, 2]}, load_json_file(path))
+
+    def test_load_json_file_with_long_digits_is_not_copied(self):
+        if json_backend.orjson is None:
+            self.skipTest("orjson is not installed")
+
+        path = self.write("data.json", b'{"ts": "1700000000000000000", "id": 1700000000000000000}')
+
+        # Only the json fallback copies the map into bytes.
+        with mock.patch.object(json_backend.json, "loads", side_effect=AssertionError("copied for json")):
+            document = load_json_file(path)
+
+        self.assertEqual({"ts": "1700000000000000000", "id": 1700000000000000000}, document)
+
+    def test_blank_lines_are_skipped(self):
+        path = self.write("data.ndjson", b'{"a": 1}\n\n   \n\t\n{"a": 2}\n')
+
+        self.assertEqual([(1, b'{"a": 1}'), (5, b'{"a": 2}')], self.records(path))
+
+    def test_last_line_without_newline(self):
+        path = self.write("data.ndjson", b'{"a": 1}\n{"a": 2}')
+
+        self.assertEqual([(1, b'{"a": 1}'), (2, b'{"a": 2}')], self.records(path))
+
+    def test_crlf_line_endings(self):
+        path = self.write("data.ndjson", b'{"a": 1}\r\n\r\n{"a": 2}\r\n')
+
+        records = self.records(path)
+
+        self.assertEqual([1, 3], [line_number for line_number, _ in records])
+        self.assertEqual([{"a": 1}, {"a": 2}], [json.loads(record) for _, record in records])
+
+    def test_stopping_early_releases_the_map(self):
+        path = self.write("data.ndjson", b'{"a": 1}\n{"a": 2}\n')
+
+        records = iter_ndjson_records(path)
+        next(records)
+        records.close()
+
+
+class TestValidateFile(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        pyschemagen._init_validator(SCHEMA)
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_passing_file(self):
+        path = self.write("data.ndjson", '{"a": 1}\n{"a": 2}\n')
+
+        result = validate_file(path)
+
+        self.assertEqual(2, result["records"])
+        self.assertEqual(0, result["error_count"])
+        self.assertEqual([], result["errors"])
+
+    def test_passing_json_file(self):
+        path = self.write("data.json", '{"a": 1}')
+
+        result = validate_file(path)
+
+        self.assertEqual(1, result["records"])
+        self.assertEqual(0, result["error_count"])
+
+    def test_failing_file(self):
+        path = self.write("data.ndjson", '{"a": 1}\n{"a": "x"}\n')
+
+        result = validate_file(path)
+
+        self.assertEqual(2, result["records"])
+        self.assertEqual(1, result["error_count"])
+        self.assertIn("line 2", result["errors"][0])
+
+    def test_undecodable_line(self):
+        path = self.write("data.ndjson", '{"a": 1}\nnot json\n')
+
+        result = validate_file(path)
+
+        self.assertEqual(2, result["records"])
+        self.assertEqual(1, result["error_count"])
+        self.assertIn("line 2", result["errors"][0])
+
+    def test_deeply_nested_line(self):
+        path = self.write("data.ndjson", '{"a": 1}\n' + "[" * 200000 + "]" * 200000 + '\n{"a": "x"}\n')
+
+        result = validate_file(path)
+
+        self.assertEqual(3, result["records"])
+        self.assertEqual(2, result["error_count"])
+        self.assertIn("line 2", result["errors"][0])
+        self.assertIn("line 3", result["errors"][1])
+
+    def test_deeply_nested_line_with_stdlib_json(self):
+        with mock.patch.object(json_backend, "orjson", None):
+            self.test_deeply_nested_line()
+
+    def test_missing_file(self):
+        path = os.path.join(self.directory.name, "missing.ndjson")
+
+        result = validate_file(path)
+
+        self.assertEqual(0, result["records"])
+        self.assertEqual(1, result["error_count"])
+        self.assertEqual(1, len(result["errors"]))
+
+    def test_reported_errors_are_limited(self):
+        path = self.write("data.ndjson", '{"a": "x"}\n' * (MAX_REPORTED_ERRORS * 3))
+
+        result = validate_file(path)
+
+        self.assertEqual(MAX_REPORTED_ERRORS * 3, result["error_count"])
+        self.assertEqual(MAX_REPORTED_ERRORS, len(result["errors"]))
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.schema_path = self.write("schema.json", json.dumps(SCHEMA))
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def run_main(self, argv):
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(output):
+            status = main(argv)
+        return status, output.getvalue()
+
+    def test_exit_status_passing(self):
+        path = self.write("data.ndjson", '{"a": 1}\n')
+
+        status, output = self.run_main(["validate", "--schema", self.schema_path, path])
+
+        self.assertEqual(0, status)
+        self.assertIn("OK", output)
+
+    def test_exit_status_failing(self):
+        good = self.write("good.ndjson", '{"a": 1}\n')
+        bad = self.write("bad.ndjson", '{"a": "x"}\n')
+
+        status, output = self.run_main(["validate", "--schema", self.schema_path,
+                                        "--jobs", "2", good, bad])
+
+        self.assertEqual(1, status)
+        self.assertIn("FAIL", output)
+
+    def test_invalid_jobs(self):
+        path = self.write("data.ndjson", '{"a": 1}\n')
+
+        for jobs in ["0", "-1", "x"]:
+            with self.assertRaises(SystemExit) as context:
+                self.run_main(["validate", "--schema", self.schema_path, "--jobs", jobs, path])
+            self.assertEqual(2, context.exception.code)
+
+    def test_invalid_schema(self):
+        path = self.write("data.ndjson", '{"a": 1}\n')
+        schema_path = self.write("bad_schema.json", '{"type": 5}')
+
+        status, output = self.run_main(["validate", "--schema", schema_path, path])
+
+        self.assertEqual(2, status)
+        self.assertIn("invalid schema", output)
+
+    def test_unreadable_schema(self):
+        path = self.write("data.ndjson", '{"a": 1}\n')
+        schema_path = self.write("bad_schema.json", 'not json')
+
+        status, output = self.run_main(["validate", "--schema", schema_path, path])
+
+        self.assertEqual(2, status)
+        self.assertIn("could not load schema", output)
+
+
+if __name__ == '__main__':
+    unittest.main()